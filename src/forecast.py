@@ -1,9 +1,14 @@
 from pathlib import Path
-from typing import Union, Optional, Tuple
+from typing import List, Union, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 import argparse
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 from src.process_fertility import FertilityProcessor
@@ -34,6 +39,7 @@ class Config:
         "data/Master Plan 2019 Subzone Boundary (No Sea) (GEOJSON).geojson"
     )
     crs: str = "urn:ogc:def:crs:OGC:1.3:CRS84"
+    geo_engine: str = "pyogrio"
     raw_preschool_data_path: Union[str, Path] = Path("data/ListingofCentres.csv")
     processed_preschool_data_path: Optional[Union[str, Path]] = Path(
         "data/preschools_data_processed.csv"
@@ -46,6 +52,10 @@ class Config:
     sheet_name: str = "2020"
     header_row: int = 2
 
+    # Caching
+    use_cache: bool = True
+    cache_dir: Union[str, Path] = Path(".cache/forecaster")
+
 
 class Forecaster:
     """
@@ -72,6 +82,7 @@ class Forecaster:
             crs=config.crs,
             raw_preschool_data_path=config.raw_preschool_data_path,
             processed_preschool_data_path=config.processed_preschool_data_path,
+            geo_engine=config.geo_engine,
         )
 
         self.current_year = config.current_year
@@ -81,76 +92,95 @@ class Forecaster:
             )
         )
 
+        # Canonical subzone axis, fixed once the input data is processed
+        self.all_subzones: Optional[pd.Index] = None
+
+
+    def pivot_women_by_subzone_and_age(
+        self, existing_women_by_age_bin: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Pivot women counts into a dense (subzone x age bin) matrix.
+
+        Args:
+            existing_women_by_age_bin: DataFrame with women counts by subzone and age bin.
+
+        Returns:
+            DataFrame with subzones as rows and the mother age bins as columns.
+        """
+        return existing_women_by_age_bin.pivot_table(
+            index="Subzone",
+            columns="Age Bin",
+            values="Count",
+            aggfunc="sum",
+            fill_value=0,
+        ).reindex(
+            columns=self.existing_residents_processor.all_mother_ages, fill_value=0
+        )
+
     def calculate_existing_preschoolers_for_year(
         self,
         target_year: int,
         fertility_rates_by_age: pd.DataFrame,
         existing_women_by_age_bin: pd.DataFrame,
+        birth_years_for_target: Optional[List[int]] = None,
+        women_by_subzone_and_age: Optional[pd.DataFrame] = None,
     ) -> pd.Series:
         """Calculate preschoolers born to existing women in each subzone for a specific forecast year.
 
         Args:
             target_year: The year to calculate preschoolers for.
-            fertility_rates_by_age: DataFrame with age-specific fertility rates by year.
+            fertility_rates_by_age: DataFrame with age-specific fertility rates by
+                year, with integer year column labels.
             existing_women_by_age_bin: DataFrame with women counts by subzone and age bin.
+            birth_years_for_target: Precomputed birth-year window for the target
+                year; derived from the fertility processor if not provided.
+            women_by_subzone_and_age: Precomputed pivot of women counts
+                (subzones x age bins); derived from existing_women_by_age_bin
+                if not provided.
 
         Returns:
             Series with preschooler counts by subzone.
         """
-        birth_years_for_target = (
-            self.fertility_processor.birth_years_for_single_forecast_year(target_year)
+        if birth_years_for_target is None:
+            birth_years_for_target = (
+                self.fertility_processor.birth_years_for_single_forecast_year(
+                    target_year
+                )
+            )
+
+        if women_by_subzone_and_age is None:
+            women_by_subzone_and_age = self.pivot_women_by_subzone_and_age(
+                existing_women_by_age_bin
+            )
+
+        # Only birth years present in the fertility data contribute births
+        birth_year_cols = [
+            birth_year
+            for birth_year in birth_years_for_target
+            if birth_year in fertility_rates_by_age.columns
+        ]
+        if not birth_year_cols:
+            return pd.Series(0, index=women_by_subzone_and_age.index, dtype=int)
+
+        # Age-specific fertility rates (per 1000 women) as an (age bin x birth year) matrix
+        fertility_rates = (
+            fertility_rates_by_age.loc[
+                self.existing_residents_processor.all_mother_ages, birth_year_cols
+            ].to_numpy()
+            / 1000
         )
 
-        # Initialize result series for each subzone - ensure unique subzones
-        all_subzones = existing_women_by_age_bin["Subzone"].unique()
-        # Convert to list and back to ensure clean unique values
-        all_subzones = list(set(all_subzones))
-        subzone_preschoolers = pd.Series(0.0, index=all_subzones)
+        # One matrix multiply yields births per (subzone x birth year)
+        births_by_birth_year = women_by_subzone_and_age.to_numpy() @ fertility_rates
 
-        for birth_year in birth_years_for_target:
-            birth_year_str = str(birth_year)
-
-            if birth_year_str in fertility_rates_by_age.columns:
-                # Get age-specific fertility rates for this birth year (per 1000 women)
-                fertility_rates_for_year = fertility_rates_by_age[birth_year_str] / 1000
-
-                # For each subzone, calculate births from existing women
-                for subzone in all_subzones:
-                    subzone_data = existing_women_by_age_bin[
-                        existing_women_by_age_bin["Subzone"] == subzone
-                    ]
-
-                    total_births_in_subzone = 0
-
-                    # Apply age-specific fertility rates to women in each age group
-                    for age_bin in self.existing_residents_processor.all_mother_ages:
-                        women_in_age_bin = subzone_data[
-                            subzone_data["Age Bin"] == age_bin
-                        ]["Count"].sum()
-
-                        if (
-                            women_in_age_bin > 0
-                            and age_bin in fertility_rates_for_year.index
-                        ):
-                            fertility_rate = fertility_rates_for_year[age_bin]
-                            births_from_age_group = women_in_age_bin * fertility_rate
-                            total_births_in_subzone += births_from_age_group
-
-                    # For most recent birth year, only count half (born early in year)
-                    if birth_year == max(birth_years_for_target):
-                        total_births_in_subzone *= 0.5
-
-                    subzone_preschoolers[subzone] += total_births_in_subzone
-
-        # Clean up results and ensure no duplicates
-        subzone_preschoolers = subzone_preschoolers.fillna(0)
-        subzone_preschoolers = subzone_preschoolers.astype(int)
-
-        # Remove any potential duplicates by grouping and summing
-        if subzone_preschoolers.index.duplicated().any():
-            subzone_preschoolers = subzone_preschoolers.groupby(
-                subzone_preschoolers.index
-            ).sum()
+        # For most recent birth year, only count half (born early in year)
+        if birth_year_cols[-1] == max(birth_years_for_target):
+            births_by_birth_year[:, -1] *= 0.5
+
+        subzone_preschoolers = pd.Series(
+            births_by_birth_year.sum(axis=1), index=women_by_subzone_and_age.index
+        )
+        subzone_preschoolers = subzone_preschoolers.round().astype(np.int32)
 
         # TODO: allow for mothers ageing through age groups
         # Not a big issue for current forecast window
@@ -162,33 +192,38 @@ class Forecaster:
         target_year: int,
         birth_rates: pd.Series,
         bto_units_by_subzone: pd.DataFrame,
+        birth_years_for_target: Optional[List[int]] = None,
     ) -> pd.Series:
         """Calculate preschoolers born to BTO mothers in each subzone for a specific forecast year.
 
         Args:
             target_year: The year to calculate preschoolers for.
-            birth_rates: Series of averaged birth rates for each year (births per woman per year).
-            bto_units_by_subzone: DataFrame of completed BTO units (rows=years, columns=subzones).
+            birth_rates: Series of averaged birth rates for each year (births per
+                woman per year), indexed by integer birth year.
+            bto_units_by_subzone: DataFrame of completed BTO units (rows=integer
+                years, columns=subzones).
+            birth_years_for_target: Precomputed birth-year window for the target
+                year; derived from the fertility processor if not provided.
 
         Returns:
             Series with preschooler counts by subzone.
         """
-        birth_years_for_target = (
-            self.fertility_processor.birth_years_for_single_forecast_year(target_year)
-        )
-        # Ensure unique column names for the index
-        unique_subzones = list(set(bto_units_by_subzone.columns))
-        subzone_preschoolers = pd.Series(0.0, index=unique_subzones)
+        if birth_years_for_target is None:
+            birth_years_for_target = (
+                self.fertility_processor.birth_years_for_single_forecast_year(
+                    target_year
+                )
+            )
+        # BTOProcessor guarantees unique subzone columns
+        subzone_preschoolers = pd.Series(0.0, index=bto_units_by_subzone.columns)
 
         for birth_year in birth_years_for_target:
-            birth_year_str = str(birth_year)
-
-            if birth_year_str in bto_units_by_subzone.index:
+            if birth_year in bto_units_by_subzone.index:
                 # BTO units available when these children were born
-                bto_units = bto_units_by_subzone.loc[birth_year_str]
+                bto_units = bto_units_by_subzone.loc[birth_year]
 
                 # Children per woman in this birth year
-                fertility_rate = birth_rates[birth_year_str]
+                fertility_rate = birth_rates[birth_year]
 
                 # Children born = BTO units × fertility rate
                 children_from_birth_year = bto_units * fertility_rate
@@ -205,32 +240,100 @@ class Forecaster:
                         / 12
                     )
 
-                # Ensure the children_from_birth_year Series has unique index
-                if children_from_birth_year.index.duplicated().any():
-                    children_from_birth_year = children_from_birth_year.groupby(children_from_birth_year.index).sum()
-
-                # Safely add values, ensuring we're adding scalars not arrays
-                for subzone in unique_subzones:
-                    if subzone in children_from_birth_year.index:
-                        # Get the value and ensure it's a scalar
-                        value_to_add = children_from_birth_year[subzone]
-                        # If it's a Series (due to duplicates), sum it
-                        if hasattr(value_to_add, 'sum'):
-                            value_to_add = float(value_to_add.sum())
-                        else:
-                            value_to_add = float(value_to_add)
-                        
-                        subzone_preschoolers[subzone] += value_to_add
-
-        subzone_preschoolers = subzone_preschoolers.fillna(0)
-        subzone_preschoolers = subzone_preschoolers.astype(int)
-        
-        # Remove any potential duplicates by grouping and summing
-        if subzone_preschoolers.index.duplicated().any():
-            subzone_preschoolers = subzone_preschoolers.groupby(subzone_preschoolers.index).sum()
+                # One vectorized add per birth year
+                subzone_preschoolers = subzone_preschoolers.add(
+                    children_from_birth_year, fill_value=0
+                )
+
+        # Series.add(fill_value=0) cannot introduce NaNs, so a single rounding
+        # cast is all the cleanup needed
+        subzone_preschoolers = subzone_preschoolers.round().astype(np.int32)
 
         return subzone_preschoolers
 
+    def calculate_bto_preschoolers_all_years(
+        self,
+        birth_rates: pd.Series,
+        bto_units_by_subzone: pd.DataFrame,
+        birth_years_by_forecast_year: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        """Calculate preschoolers born to BTO mothers for all forecast years at once.
+
+        Builds a (birth year x forecast year) weight matrix encoding each
+        forecast year's birth window (with the most recent birth year scaled
+        down for children below the minimum preschool age) and computes every
+        subzone/forecast-year combination with a single matrix multiply.
+
+        Args:
+            birth_rates: Series of averaged birth rates for each year (births per
+                woman per year), indexed by integer birth year.
+            bto_units_by_subzone: DataFrame of completed BTO units (rows=integer
+                years, columns=subzones).
+            birth_years_by_forecast_year: Precomputed birth-year windows keyed by
+                forecast year; derived from the fertility processor if not provided.
+
+        Returns:
+            DataFrame with forecast years as rows and subzones as columns.
+        """
+        if birth_years_by_forecast_year is None:
+            birth_years_by_forecast_year = {
+                forecast_year: self.fertility_processor.birth_years_for_single_forecast_year(
+                    forecast_year
+                )
+                for forecast_year in self.forecast_years
+            }
+        forecast_years = list(birth_years_by_forecast_year)
+
+        # Birth years that have both BTO units and a birth rate available
+        usable_birth_years = sorted(
+            {
+                birth_year
+                for birth_years in birth_years_by_forecast_year.values()
+                for birth_year in birth_years
+                if birth_year in bto_units_by_subzone.index
+                and birth_year in birth_rates.index
+            }
+        )
+        if not usable_birth_years:
+            return pd.DataFrame(
+                0,
+                index=forecast_years,
+                columns=bto_units_by_subzone.columns,
+                dtype=np.int32,
+            )
+
+        # Children born per subzone per birth year: units x rate
+        units = bto_units_by_subzone.loc[usable_birth_years].to_numpy(dtype=np.float64)
+        rates = birth_rates.loc[usable_birth_years].to_numpy()
+        births_by_birth_year = units * rates[:, None]
+
+        # Weight matrix mapping birth years into forecast-year windows
+        partial_year_weight = 1.0
+        if self.config.min_preschool_age % 12 != 0:
+            partial_year_weight = (12 - self.config.min_preschool_age % 12) / 12
+        birth_year_positions = {
+            birth_year: position
+            for position, birth_year in enumerate(usable_birth_years)
+        }
+        weights = np.zeros((len(usable_birth_years), len(forecast_years)))
+        for year_idx, birth_years in enumerate(birth_years_by_forecast_year.values()):
+            most_recent_birth_year = max(birth_years)
+            for birth_year in birth_years:
+                position = birth_year_positions.get(birth_year)
+                if position is not None:
+                    weights[position, year_idx] = (
+                        partial_year_weight
+                        if birth_year == most_recent_birth_year
+                        else 1.0
+                    )
+
+        bto_preschoolers = births_by_birth_year.T @ weights
+        return pd.DataFrame(
+            bto_preschoolers.T.round().astype(np.int32),
+            index=forecast_years,
+            columns=bto_units_by_subzone.columns,
+        )
+
     def calculate_preschoolers_for_year(
         self,
         target_year: int,
@@ -238,6 +341,8 @@ class Forecaster:
         bto_units_by_subzone: pd.DataFrame,
         fertility_rates_by_age: pd.DataFrame,
         existing_women_by_age_bin: pd.DataFrame,
+        birth_years_for_target: Optional[List[int]] = None,
+        women_by_subzone_and_age: Optional[pd.DataFrame] = None,
     ) -> pd.Series:
         """Calculate total preschoolers in each subzone for a specific forecast year.
 
@@ -247,40 +352,42 @@ class Forecaster:
             bto_units_by_subzone: DataFrame of completed BTO units.
             fertility_rates_by_age: DataFrame with age-specific fertility rates by year.
             existing_women_by_age_bin: DataFrame with women counts by subzone and age bin.
+            birth_years_for_target: Precomputed birth-year window for the target
+                year; derived from the fertility processor if not provided.
+            women_by_subzone_and_age: Precomputed pivot of women counts
+                (subzones x age bins); derived from existing_women_by_age_bin
+                if not provided.
 
         Returns:
             Series with total preschooler counts by subzone.
         """
+        # Compute the birth-year window once and share it between both sources
+        if birth_years_for_target is None:
+            birth_years_for_target = (
+                self.fertility_processor.birth_years_for_single_forecast_year(
+                    target_year
+                )
+            )
+
         # Calculate preschoolers from existing residents
         existing_preschoolers = self.calculate_existing_preschoolers_for_year(
-            target_year, fertility_rates_by_age, existing_women_by_age_bin
+            target_year,
+            fertility_rates_by_age,
+            existing_women_by_age_bin,
+            birth_years_for_target,
+            women_by_subzone_and_age,
         )
 
         # Calculate preschoolers from BTO mothers
         bto_preschoolers = self.calculate_bto_preschoolers_for_year(
-            target_year, bto_birth_rates, bto_units_by_subzone
+            target_year, bto_birth_rates, bto_units_by_subzone, birth_years_for_target
         )
 
-        # Ensure both Series are clean with no duplicates
-        if existing_preschoolers.index.duplicated().any():
-            existing_preschoolers = existing_preschoolers.groupby(existing_preschoolers.index).sum()
-        
-        if bto_preschoolers.index.duplicated().any():
-            bto_preschoolers = bto_preschoolers.groupby(bto_preschoolers.index).sum()
-
-        # Combine both sources using a more robust approach
-        all_subzones = list(set(existing_preschoolers.index) | set(bto_preschoolers.index))
-        total_preschoolers = pd.Series(0, index=all_subzones, dtype=int)
-
-        # Add existing preschoolers
-        for subzone in existing_preschoolers.index:
-            if subzone in total_preschoolers.index:
-                total_preschoolers[subzone] += int(existing_preschoolers[subzone])
-
-        # Add BTO preschoolers
-        for subzone in bto_preschoolers.index:
-            if subzone in total_preschoolers.index:
-                total_preschoolers[subzone] += int(bto_preschoolers[subzone])
+        # Both helpers return uniquely-indexed Series, so the sources combine
+        # with a single aligned add
+        total_preschoolers = existing_preschoolers.add(
+            bto_preschoolers, fill_value=0
+        ).astype(np.int32)
 
         return total_preschoolers
 
@@ -305,30 +412,120 @@ class Forecaster:
         print("TOTAL PRESCHOOLER PROJECTIONS BY YEAR (EXISTING + BTO)")
         print("=" * 60)
 
-        # Dictionary to store results for each year
-        results_by_year = {}
+        # Contract at the boundary: the processors guarantee canonical inputs,
+        # so verify once here instead of re-checking inside every helper
+        if not bto_units_by_subzone.columns.is_unique:
+            print("Warning: duplicate BTO subzone columns found, canonicalizing")
+            bto_units_by_subzone = bto_units_by_subzone.T.groupby(level=0).sum().T
+        if not fertility_rates_by_age.columns.is_unique:
+            print("Warning: duplicate fertility year columns found, canonicalizing")
+            fertility_rates_by_age = fertility_rates_by_age.loc[
+                :, ~fertility_rates_by_age.columns.duplicated()
+            ]
+        if existing_women_by_age_bin.duplicated(
+            subset=["Subzone", "Age Bin"]
+        ).any():
+            print("Warning: duplicate (Subzone, Age Bin) rows found, canonicalizing")
+            existing_women_by_age_bin = (
+                existing_women_by_age_bin.groupby(
+                    ["Subzone", "Age Bin"], observed=True, sort=False
+                )["Count"]
+                .sum()
+                .reset_index()
+            )
 
-        # Loop through each forecast year
-        for forecast_year in self.forecast_years:
-            print(f"\nForecasting total preschoolers for {forecast_year}")
+        # Normalize year labels to integers once; integer hashing is much
+        # cheaper than string hashing in the per-year lookups below
+        fertility_rates_by_age = fertility_rates_by_age.set_axis(
+            fertility_rates_by_age.columns.astype(int), axis=1
+        )
+        bto_units_by_subzone = bto_units_by_subzone.set_axis(
+            bto_units_by_subzone.index.astype(int), axis=0
+        )
+        bto_birth_rates = bto_birth_rates.set_axis(bto_birth_rates.index.astype(int))
+
+        # Hoist loop invariants: birth-year windows per forecast year, and
+        # input frames trimmed to only the birth years those windows cover
+        birth_years_by_forecast_year = {
+            forecast_year: self.fertility_processor.birth_years_for_single_forecast_year(
+                forecast_year
+            )
+            for forecast_year in self.forecast_years
+        }
+        all_birth_years = sorted(
+            {
+                birth_year
+                for birth_years in birth_years_by_forecast_year.values()
+                for birth_year in birth_years
+            }
+        )
+        fertility_rates_by_age = fertility_rates_by_age[
+            fertility_rates_by_age.columns.intersection(all_birth_years)
+        ]
+        bto_birth_rates = bto_birth_rates[
+            bto_birth_rates.index.intersection(all_birth_years)
+        ]
 
-            # Calculate total preschoolers for this year
-            preschoolers = self.calculate_preschoolers_for_year(
+        # Pivot women counts once; together with the BTO columns this fixes
+        # the full subzone axis for every forecast year
+        women_by_subzone_and_age = self.pivot_women_by_subzone_and_age(
+            existing_women_by_age_bin
+        )
+        all_subzones = self.all_subzones
+        if all_subzones is None:
+            all_subzones = pd.Index(
+                sorted(
+                    set(women_by_subzone_and_age.index)
+                    | set(bto_units_by_subzone.columns)
+                )
+            )
+
+        # Preallocate the result matrix and fill one row per forecast year
+        preschoolers_arr = np.zeros(
+            (len(self.forecast_years), len(all_subzones)), dtype=np.int32
+        )
+
+        # All BTO contributions come from a single matrix multiply
+        bto_preschoolers_all_years = self.calculate_bto_preschoolers_all_years(
+            bto_birth_rates, bto_units_by_subzone, birth_years_by_forecast_year
+        )
+
+        def preschoolers_for(forecast_year: int) -> pd.Series:
+            print(f"\nForecasting total preschoolers for {forecast_year}")
+            existing_preschoolers = self.calculate_existing_preschoolers_for_year(
                 forecast_year,
-                bto_birth_rates,
-                bto_units_by_subzone,
                 fertility_rates_by_age,
                 existing_women_by_age_bin,
+                birth_years_by_forecast_year[forecast_year],
+                women_by_subzone_and_age,
+            )
+            return existing_preschoolers.add(
+                bto_preschoolers_all_years.loc[forecast_year], fill_value=0
             )
 
-            # Store results
-            results_by_year[forecast_year] = preschoolers
-
-        # Convert to DataFrame (rows = years, columns = subzones)
-        preschoolers_df = pd.DataFrame(results_by_year).T
-
-        # Fill any missing values with 0
-        preschoolers_df = preschoolers_df.fillna(0)
+        # The per-year work is dominated by NumPy/BLAS calls that release the
+        # GIL, so the years can run on a thread pool
+        if len(self.forecast_years) > 1:
+            max_workers = min(len(self.forecast_years), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                preschoolers_by_year = list(
+                    executor.map(preschoolers_for, self.forecast_years)
+                )
+        else:
+            preschoolers_by_year = [
+                preschoolers_for(forecast_year)
+                for forecast_year in self.forecast_years
+            ]
+
+        for year_idx, preschoolers in enumerate(preschoolers_by_year):
+            preschoolers_arr[year_idx] = preschoolers.reindex(
+                all_subzones, fill_value=0
+            ).to_numpy()
+
+        # Wrap as DataFrame (rows = years, columns = subzones)
+        preschoolers_df = pd.DataFrame(
+            preschoolers_arr, index=self.forecast_years, columns=all_subzones
+        )
 
         # Overall summary by year
         print(f"\nTotal preschoolers by year:")
@@ -358,20 +555,95 @@ class Forecaster:
                 subzones. Positive values indicate a surplus, negative values indicate
                 a shortage.
         """
+        # Align existing supply to the forecast columns and subtract in one
+        # broadcast operation (surplus positive, shortage negative). Subzones
+        # without existing-preschool data keep the original needed counts,
+        # matching the previous per-cell behaviour.
+        common_subzones = forecasted_preschools_needed.columns.intersection(
+            existing_preschools.index
+        )
         preschool_gap = forecasted_preschools_needed.copy()
-        common_subzones = list(
-            set(existing_preschools.index) & set(preschool_gap.columns)
+        preschool_gap[common_subzones] = (
+            existing_preschools.loc[common_subzones, "num_preschools"]
+            - forecasted_preschools_needed[common_subzones]
         )
 
-        for year in preschool_gap.index:
-            for subzone in common_subzones:
-                preschool_gap.loc[year, subzone] = (
-                    existing_preschools.loc[subzone, "num_preschools"]
-                    - preschool_gap.loc[year, subzone]
-                )
-
         return preschool_gap
 
+    # File names for the cached run() outputs, in return order
+    _CACHE_FILES = (
+        "existing_preschools_by_subzone.parquet",
+        "forecasted_num_preschoolers.parquet",
+        "forecasted_preschools_needed.parquet",
+        "preschool_gap.parquet",
+    )
+
+    def _run_cache_key(self) -> Optional[str]:
+        """Build a cache key from the config and input-file mtimes.
+
+        Returns:
+            A hex digest, or None if any input path cannot be keyed reliably
+            (e.g. a missing file or a non-path input).
+        """
+        config = self.config
+        parts = [
+            config.num_forecast_years,
+            config.preschool_capacity,
+            config.min_preschool_age,
+            config.max_preschool_age,
+            config.sheet_name,
+            config.header_row,
+            config.crs,
+            self.current_year,
+        ]
+        for path in (
+            config.fertility_data_path,
+            config.bto_data_path,
+            config.existing_residents_path,
+            config.subzone_data_path,
+            config.raw_preschool_data_path,
+            config.processed_preschool_data_path,
+        ):
+            if path is None:
+                parts.append("none")
+                continue
+            try:
+                path = Path(path)
+                parts.append(f"{path}:{path.stat().st_mtime_ns}")
+            except (TypeError, OSError):
+                return None
+        return hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+
+    def _load_cached_run(
+        self, run_cache_dir: Path
+    ) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+        """Load a previously cached run() result, or None if unavailable."""
+        if not all((run_cache_dir / name).exists() for name in self._CACHE_FILES):
+            return None
+        try:
+            existing_preschools = gpd.read_parquet(
+                run_cache_dir / self._CACHE_FILES[0]
+            )
+            others = tuple(
+                pd.read_parquet(run_cache_dir / name) for name in self._CACHE_FILES[1:]
+            )
+        except (OSError, ValueError):
+            return None
+        return (existing_preschools,) + others
+
+    def _save_cached_run(
+        self,
+        run_cache_dir: Path,
+        results: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame],
+    ) -> None:
+        """Persist a run() result to the cache directory, ignoring failures."""
+        try:
+            run_cache_dir.mkdir(parents=True, exist_ok=True)
+            for name, result in zip(self._CACHE_FILES, results):
+                result.to_parquet(run_cache_dir / name)
+        except (ImportError, OSError, ValueError):
+            pass
+
     def run(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
         Forecast the number of preschoolers in each subzone for the given forecast years,
@@ -387,6 +659,17 @@ class Forecaster:
             forecasted_preschools_needed: DataFrame of forecasted preschools needed by subzone.
             preschool_gap: DataFrame of preschool supply/demand gap by subzone.
         """
+        # Serve unchanged-input re-runs straight from the on-disk cache
+        run_cache_dir = None
+        if self.config.use_cache:
+            cache_key = self._run_cache_key()
+            if cache_key is not None:
+                run_cache_dir = Path(self.config.cache_dir) / cache_key
+                cached_results = self._load_cached_run(run_cache_dir)
+                if cached_results is not None:
+                    print(f"Loading cached forecast results from {run_cache_dir}")
+                    return cached_results
+
         print("Running comprehensive preschool demand forecast...")
 
         # Get fertility data (both averaged for BTO and age-specific for existing residents)
@@ -412,6 +695,14 @@ class Forecaster:
         bto_units_by_subzone = self.bto_processor.run(self.forecast_years)
         existing_women_by_age_bin = self.existing_residents_processor.run()
 
+        # Fix the canonical subzone axis once for the whole forecast run
+        self.all_subzones = pd.Index(
+            sorted(
+                set(existing_women_by_age_bin["Subzone"].unique())
+                | set(bto_units_by_subzone.columns)
+            )
+        )
+
         # Calculate total preschoolers from both sources
         forecasted_num_preschoolers = self.calculate_preschoolers_all_years(
             bto_birth_rates,
@@ -433,13 +724,18 @@ class Forecaster:
             existing_preschools_by_subzone, forecasted_preschools_needed
         )
 
-        return (
+        results = (
             existing_preschools_by_subzone,
             forecasted_num_preschoolers,
             forecasted_preschools_needed,
             preschool_gap,
         )
 
+        if run_cache_dir is not None:
+            self._save_cached_run(run_cache_dir, results)
+
+        return results
+
 
 if __name__ == "__main__":
     # Set up argument parser
@@ -524,6 +820,11 @@ if __name__ == "__main__":
         default="data/preschools_data_processed.csv",
         help="Path to processed preschool data CSV",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the forecast even if cached results exist",
+    )
 
     # Parse arguments
     args = parser.parse_args()
@@ -543,6 +844,7 @@ if __name__ == "__main__":
         crs=args.crs,
         raw_preschool_data_path=Path(args.raw_preschool_data_path),
         processed_preschool_data_path=Path(args.processed_preschool_data_path),
+        use_cache=not args.no_cache,
     )
 
     forecaster = Forecaster(forecaster_config)
@@ -11,6 +11,11 @@ class BTOProcessor:
 
     def __init__(self, bto_data_path: Union[str, Path]) -> None:
         self.bto_data = pd.read_csv(bto_data_path)
+        # Canonicalize subzone names once at load time; the categorical dtype
+        # lets later groupbys hash integer codes instead of strings
+        self.bto_data["Subzone"] = (
+            self.bto_data["Subzone"].str.strip().astype("category")
+        )
 
     def get_cumulative_bto_units_by_subzone(self, years: List[int]) -> pd.DataFrame:
         """
@@ -28,20 +33,35 @@ class BTOProcessor:
             self.bto_data["Estimated completion year"] <= max(years)
         ]
 
-        bto_units_by_subzone = pd.pivot_table(
-            bto_data_for_forecast,
-            values="Total number of units",
-            index="Subzone",
-            columns="Estimated completion year",
-            aggfunc="sum",
-            fill_value=0,
-        ).cumsum(axis=1)
+        bto_units_by_subzone = (
+            bto_data_for_forecast.groupby(
+                ["Subzone", "Estimated completion year"], sort=True, observed=True
+            )["Total number of units"]
+            .sum()
+            .unstack(fill_value=0)
+        )
+
+        # Fill gaps in completion years so cumulative unit counts carry
+        # forward through years with no new completions
+        if len(bto_units_by_subzone.columns) > 0:
+            all_completion_years = range(
+                int(bto_units_by_subzone.columns.min()), max(years) + 1
+            )
+            bto_units_by_subzone = bto_units_by_subzone.reindex(
+                columns=all_completion_years, fill_value=0
+            )
+
+        bto_units_by_subzone = bto_units_by_subzone.cumsum(axis=1)
 
         bto_units_by_subzone.columns = bto_units_by_subzone.columns.astype(str)
         bto_units_by_subzone = bto_units_by_subzone.transpose()
 
-        # Remove whitespace from subzone names
-        bto_units_by_subzone.columns = bto_units_by_subzone.columns.str.strip()
+        # Subzone names were stripped at load time, so duplicate columns can
+        # only come from genuine duplicates in the source data
+        if not bto_units_by_subzone.columns.is_unique:
+            bto_units_by_subzone = (
+                bto_units_by_subzone.T.groupby(level=0).sum().T
+            )
 
         return bto_units_by_subzone
 
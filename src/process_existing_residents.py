@@ -1,8 +1,14 @@
 from pathlib import Path
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # polars is an optional accelerator for Excel parsing
+    pl = None
+
 
 class ExistingResidentsProcessor:
     """
@@ -38,20 +44,94 @@ class ExistingResidentsProcessor:
         self.existing_residents_in_subzones = None
         self.existing_women_by_age_bin = None
         self.age_bins = None
+        self._bin_for_age = None
 
     def load_existing_residents_data(self) -> pd.DataFrame:
         """
         Loads existing residents data from Excel file.
 
+        XLSX parsing is slow, so the parsed sheet is cached as a Parquet
+        sidecar next to the Excel file and reused on subsequent runs as long
+        as it is newer than the source.
+
         Returns:
             Raw pandas DataFrame with existing residents data.
         """
-        print(f"Loading existing residents data from {self.existing_residents_path}")
-        self.existing_residents_data = pd.read_excel(
-            self.existing_residents_path, 
-            sheet_name=self.sheet_name, 
-            header=self.header_row
+        xlsx_path = Path(self.existing_residents_path)
+        # The cached contents depend on which sheet was parsed, so key the
+        # sidecar per sheet; a cache written for one year must not be served
+        # when the processor is configured for another
+        parquet_path = xlsx_path.with_name(
+            f"{xlsx_path.stem}.{self.sheet_name}.parquet"
         )
+
+        if (
+            parquet_path.exists()
+            and parquet_path.stat().st_mtime >= xlsx_path.stat().st_mtime
+        ):
+            print(f"Loading cached existing residents data from {parquet_path}")
+            data = pd.read_parquet(parquet_path, engine="pyarrow")
+            # Parquet requires string column names; restore the year column label
+            data.columns = [
+                int(column) if str(column).isdigit() else column
+                for column in data.columns
+            ]
+        else:
+            print(f"Loading existing residents data from {xlsx_path}")
+            # Only parse the columns the pipeline actually uses
+            wanted_columns = {"Subzone", "Age", "Sex", self.sheet_name}
+            if self.sheet_name.isdigit():
+                wanted_columns.add(int(self.sheet_name))
+            data = None
+            if pl is not None:
+                # polars with the calamine engine parses the workbook fastest
+                # and hands the result to pandas as Arrow-backed columns
+                # without copying the buffers
+                try:
+                    frame = pl.read_excel(
+                        xlsx_path,
+                        sheet_name=self.sheet_name,
+                        engine="calamine",
+                        read_options={"header_row": self.header_row},
+                    )
+                    data = frame.select(
+                        [column for column in frame.columns if column in wanted_columns]
+                    ).to_pandas(use_pyarrow_extension_array=True)
+                    # polars reads every header as text; restore the year label
+                    data.columns = [
+                        int(column) if str(column).isdigit() else column
+                        for column in data.columns
+                    ]
+                except ImportError:
+                    # fastexcel (polars' calamine backend) is not installed
+                    data = None
+            if data is None:
+                # calamine parses xlsx several times faster than openpyxl; fall
+                # back to the default engine where it is not installed
+                try:
+                    data = pd.read_excel(
+                        xlsx_path,
+                        sheet_name=self.sheet_name,
+                        header=self.header_row,
+                        usecols=lambda column: column in wanted_columns,
+                        engine="calamine",
+                    )
+                except ImportError:
+                    data = pd.read_excel(
+                        xlsx_path,
+                        sheet_name=self.sheet_name,
+                        header=self.header_row,
+                        usecols=lambda column: column in wanted_columns,
+                    )
+            cache = data.copy()
+            cache.columns = cache.columns.astype(str)
+            try:
+                cache.to_parquet(parquet_path)
+            except (ImportError, OSError):
+                # No parquet engine or read-only data directory; just skip caching
+                pass
+
+        self.existing_residents_data = data
         return self.existing_residents_data
 
     def clean_existing_residents_data(self) -> pd.DataFrame:
@@ -62,22 +142,29 @@ class ExistingResidentsProcessor:
             Cleaned pandas DataFrame with subzone-level female residents by age.
         """
         print("Cleaning existing residents data...")
-        
-        # Filter out total rows and keep only females
-        cleaned_data = self.existing_residents_data[
-            self.existing_residents_data["Subzone"] != "Total"
-        ]
-        cleaned_data = cleaned_data[cleaned_data["Age"] != "Total"]
-        cleaned_data = cleaned_data[cleaned_data["Sex"] != "Total"]
-        cleaned_data = cleaned_data[cleaned_data["Sex"] != "Males"]
-        
-        # Select relevant columns and rename
+
+        data = self.existing_residents_data
         year_column = int(self.sheet_name)  # Assuming sheet name is the year
-        cleaned_data = cleaned_data[["Subzone", "Age", year_column]].copy()
+
+        # Filter out total rows and keep only females, in a single mask so only
+        # one intermediate DataFrame is materialized
+        mask = (
+            (data["Subzone"] != "Total")
+            & (data["Age"] != "Total")
+            & (data["Sex"] == "Females")
+        )
+        cleaned_data = data.loc[mask, ["Subzone", "Age", year_column]].copy()
         cleaned_data.rename(columns={year_column: "Count"}, inplace=True)
-        
-        # Convert Count to numeric, handling any non-numeric values
-        cleaned_data["Count"] = pd.to_numeric(cleaned_data["Count"], errors='coerce')
+
+        # With the Total rows filtered out, the counts should be clean numbers;
+        # cast straight to int32 and only fall back to coercion (dropping the
+        # stray rows) if the column still contains non-numeric values
+        try:
+            cleaned_data["Count"] = cleaned_data["Count"].astype(np.int32)
+        except (ValueError, TypeError):
+            counts = pd.to_numeric(cleaned_data["Count"], errors="coerce")
+            cleaned_data = cleaned_data[counts.notna()]
+            cleaned_data["Count"] = counts[counts.notna()].astype(np.int32)
         
         self.existing_residents_in_subzones = cleaned_data
         return self.existing_residents_in_subzones
@@ -86,21 +173,27 @@ class ExistingResidentsProcessor:
         """
         Creates mapping from individual ages to age bins.
 
+        Also builds an integer lookup array (age -> bin code) so that the
+        aggregation step can fancy-index ages instead of hashing strings.
+
         Returns:
             Dictionary mapping age strings to age bin names.
         """
         print("Creating age bins mapping...")
-        
-        age_bins = {
-            str(age): bin_name
-            for bin_name in self.all_mother_ages
-            for age in range(
-                int(bin_name.split(" - ")[0]), 
-                int(bin_name.split(" - ")[1].replace(" Years", "")) + 1
-            )
+
+        # Lookup array indexed by integer age; -1 marks ages outside all bins
+        bin_for_age = np.full(100, -1, dtype=np.int8)
+        for bin_code, bin_name in enumerate(self.all_mother_ages):
+            min_age = int(bin_name.split(" - ")[0])
+            max_age = int(bin_name.split(" - ")[1].replace(" Years", ""))
+            bin_for_age[min_age : max_age + 1] = bin_code
+        self._bin_for_age = bin_for_age
+
+        self.age_bins = {
+            str(age): self.all_mother_ages[bin_code]
+            for age, bin_code in enumerate(bin_for_age)
+            if bin_code >= 0
         }
-        
-        self.age_bins = age_bins
         return self.age_bins
 
     def aggregate_women_by_age_bin(self) -> pd.DataFrame:
@@ -114,15 +207,25 @@ class ExistingResidentsProcessor:
         
         # Create a copy to avoid modifying original data
         women_by_age_bin = self.existing_residents_in_subzones.copy()
-        
-        # Map ages to age bins
-        women_by_age_bin["Age Bin"] = women_by_age_bin["Age"].astype(str).map(self.age_bins)
-        
+
+        # Map ages to age bins via the integer lookup array; non-numeric or
+        # out-of-range ages get code -1 and surface as NaN in the categorical
+        ages = pd.to_numeric(women_by_age_bin["Age"], errors="coerce")
+        bin_codes = self._bin_for_age[
+            ages.fillna(-1).astype(int).clip(0, len(self._bin_for_age) - 1).to_numpy()
+        ]
+        women_by_age_bin["Age Bin"] = pd.Categorical.from_codes(
+            bin_codes, categories=self.all_mother_ages, ordered=True
+        )
+        women_by_age_bin["Subzone"] = women_by_age_bin["Subzone"].astype("category")
+
         # Drop rows where mapping failed
         women_by_age_bin = women_by_age_bin.dropna(subset=["Count", "Age Bin"])
-        
+
         # Group by subzone and age bin
-        women_by_age_bin = women_by_age_bin.groupby(["Subzone", "Age Bin"])["Count"].sum()
+        women_by_age_bin = women_by_age_bin.groupby(
+            ["Subzone", "Age Bin"], observed=True, sort=False
+        )["Count"].sum()
         women_by_age_bin = pd.DataFrame(women_by_age_bin).reset_index()
         
         self.existing_women_by_age_bin = women_by_age_bin
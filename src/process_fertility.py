@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -31,6 +32,11 @@ class FertilityProcessor:
         self.min_preschool_age = min_preschool_age
         self.max_preschool_age = max_preschool_age
 
+        # Birth-year window offsets are constants of the instance; precompute
+        # them once so each per-year window is just two subtractions
+        self._max_offset = round(self.max_preschool_age / 12)
+        self._min_offset = round(self.min_preschool_age / 12)
+
         self.mother_ages = [
             "20 - 24 Years",
             "25 - 29 Years",
@@ -38,7 +44,16 @@ class FertilityProcessor:
             "35 - 39 Years",
         ]
 
-    def birth_years_for_single_forecast_year(self, forecast_year: int) -> List[int]:
+        # Cache the mother-age rates as a plain (age group x year) float array
+        # so the hot rate lookups are NumPy gathers rather than label-based
+        # DataFrame indexing
+        mother_age_rates = self.fertility_data.loc[self.mother_ages]
+        year_order = mother_age_rates.columns.astype(int).argsort()
+        mother_age_rates = mother_age_rates.iloc[:, year_order]
+        self._rate_years = mother_age_rates.columns.astype(int).to_numpy()
+        self._rates = mother_age_rates.to_numpy(dtype=np.float64)
+
+    def birth_years_for_single_forecast_year(self, forecast_year: int) -> range:
         """
         Computes the birth years of preschoolers for a given year.
 
@@ -46,11 +61,11 @@ class FertilityProcessor:
             forecast_year: The year to compute the birth years for.
 
         Returns:
-            A list of birth years.
+            A range of birth years.
         """
-        start_birth_year = forecast_year - round(self.max_preschool_age / 12)
-        end_birth_year = forecast_year - round(self.min_preschool_age / 12)
-        return list(range(start_birth_year, end_birth_year + 1))
+        return range(
+            forecast_year - self._max_offset, forecast_year - self._min_offset + 1
+        )
 
     def birth_years_for_multiple_forecast_years(self, forecast_years: List[int]) -> List[int]:
         """
@@ -60,19 +75,14 @@ class FertilityProcessor:
             forecast_years: A list of forecast years.
 
         Returns:
-            A list of birth years.
+            A sorted list of birth years covering every forecast year's window.
         """
-        birth_years_all = None
+        birth_years_all = set()
         for forecast_year in forecast_years:
-            if birth_years_all is None:
-                birth_years_all = self.birth_years_for_single_forecast_year(
-                    forecast_year
-                )
-            else:
-                birth_years_all.append(
-                    max(self.birth_years_for_single_forecast_year(forecast_year))
-                )
-        return birth_years_all
+            birth_years_all.update(
+                self.birth_years_for_single_forecast_year(forecast_year)
+            )
+        return sorted(birth_years_all)
 
     def extrapolate_births(self, birth_years: List[int]) -> pd.DataFrame:
         """
@@ -85,19 +95,28 @@ class FertilityProcessor:
         Returns:
             A pandas DataFrame with the extrapolated births.
         """
-        available_years = self.fertility_data.columns
-        available_years = [int(year) for year in available_years]
+        available_years = [int(year) for year in self.fertility_data.columns]
         latest_available_year = max(available_years)
 
         if latest_available_year < max(birth_years):
             print(
                 f"Extrapolating births for years {latest_available_year+1} to {max(birth_years)}"
             )
-            for year in range(latest_available_year + 1, max(birth_years) + 1):
-                if year not in available_years:
-                    self.fertility_data[str(year)] = self.fertility_data[
-                        str(latest_available_year)
-                    ]
+            # Add all missing years in a single concat rather than growing the
+            # DataFrame one column assignment at a time
+            missing_years = [
+                str(year)
+                for year in range(latest_available_year + 1, max(birth_years) + 1)
+                if year not in available_years
+            ]
+            latest_rates = self.fertility_data[str(latest_available_year)].to_numpy()
+            extrapolated = pd.DataFrame(
+                {year: latest_rates for year in missing_years},
+                index=self.fertility_data.index,
+            )
+            self.fertility_data = pd.concat(
+                [self.fertility_data, extrapolated], axis=1
+            )
 
         return self.fertility_data
 
@@ -108,16 +127,55 @@ class FertilityProcessor:
         Args:
             birth_years: A list of birth years.
 
+        Birth years beyond the latest available data year are extrapolated by
+        reading from the latest available column, so no extra columns need to
+        be materialized in the fertility DataFrame.
+
         Returns:
-            A pandas Series with the average birth rate per woman per year.
+            A pandas Series with the average birth rate per woman per year,
+            indexed by birth year.
         """
-        # Birth rate by age group, per 1000 women per year
-        birth_rate_by_age = self.fertility_data.loc[
-            self.mother_ages, [str(year) for year in birth_years]
-        ]
-        # Average across age groups
-        avg_birth_rate_per_woman_per_year = birth_rate_by_age.mean(axis=0) / 1000
-        return avg_birth_rate_per_woman_per_year
+        # Clamp to the latest available year, gather the per-age-group rates
+        # (per 1000 women per year) from the cached array, and average across
+        # age groups
+        effective_years = np.clip(birth_years, None, self._rate_years[-1])
+        columns = np.searchsorted(self._rate_years, effective_years)
+        rates = self._rates[:, columns].mean(axis=0) / 1000
+        return pd.Series(rates, index=birth_years)
+
+    def get_birth_rates_by_forecast_year(self, forecast_years: List[int]) -> pd.Series:
+        """
+        Computes the mean birth rate over each forecast year's birth-year window.
+
+        The per-birth-year rates are computed once and folded into forecast
+        years with a single bincount reduction, so callers who only need one
+        averaged rate per forecast year do not have to regroup downstream.
+
+        Args:
+            forecast_years: A list of forecast years.
+
+        Returns:
+            A pandas Series with the mean birth rate per woman per year,
+            indexed by forecast year.
+        """
+        birth_years = self.birth_years_for_multiple_forecast_years(forecast_years)
+        rates_by_birth_year = self.get_birth_rates_for_forecast_years(birth_years)
+        rate_values = rates_by_birth_year.to_numpy()
+        birth_year_array = np.asarray(birth_years)
+
+        buckets = []
+        rate_columns = []
+        for bucket, forecast_year in enumerate(forecast_years):
+            window = self.birth_years_for_single_forecast_year(forecast_year)
+            columns = np.searchsorted(birth_year_array, np.arange(window.start, window.stop))
+            buckets.append(np.full(len(window), bucket))
+            rate_columns.append(columns)
+        buckets = np.concatenate(buckets)
+        window_rates = rate_values[np.concatenate(rate_columns)]
+
+        sums = np.bincount(buckets, weights=window_rates, minlength=len(forecast_years))
+        counts = np.bincount(buckets, minlength=len(forecast_years))
+        return pd.Series(sums / counts, index=forecast_years)
 
     def run(self, forecast_years: List[int]) -> pd.Series:
         """
@@ -132,8 +190,7 @@ class FertilityProcessor:
         print(f"Processing fertility data for forecast years: {forecast_years}")
         self.birth_years = self.birth_years_for_multiple_forecast_years(forecast_years)
         print(f"Birth years: {self.birth_years}")
-        
-        self.fertility_data = self.extrapolate_births(self.birth_years)
+
         birth_rates = self.get_birth_rates_for_forecast_years(self.birth_years)
         return birth_rates
 
@@ -1,12 +1,31 @@
 import html
+import json
 import re
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+from shapely.strtree import STRtree
+
+# Pattern to match the SUBZONE_N row in the HTML table
+# Looks for: <th>SUBZONE_N</th> <td>SUBZONE_NAME</td>
+_SUBZONE_PATTERN = re.compile(r"<th>SUBZONE_N<\/th>\s*<td>([^<]+)<\/td>")
+
+# Fallback: any text that looks like a subzone name, for rows where the
+# HTML structure might be slightly different
+_SUBZONE_FALLBACK_PATTERN = re.compile(
+    r"SUBZONE_N.*?<td>([^<]+)<\/td>", re.IGNORECASE | re.DOTALL
+)
+
+
+def _unescape_if_needed(name: str) -> str:
+    """Unescape HTML entities, skipping the call for entity-free strings."""
+    return html.unescape(name) if "&" in name else name
 
 
 class PreschoolProcessor:
@@ -20,6 +39,8 @@ class PreschoolProcessor:
         crs: str,
         raw_preschool_data_path: Union[str, Path],
         processed_preschool_data_path: Optional[Union[str, Path]] = None,
+        postal_lookup_path: Optional[Union[str, Path]] = None,
+        geo_engine: str = "pyogrio",
     ):
         """
         Initializes the PreschoolProcessor.
@@ -31,19 +52,43 @@ class PreschoolProcessor:
             crs: The coordinate reference system of the subzone data.
             raw_preschool_data_path: The path to the raw preschool data CSV.
             processed_preschool_data_path: The path to the preprocessed preschool data CSV.
+            postal_lookup_path: Optional path to a local postal-code-to-lat/lon
+                table (parquet with 'postal_code', 'lat' and 'lon' columns);
+                codes found here skip the OneMap API entirely.
+            geo_engine: The geopandas engine used to read the subzone GeoJSON;
+                pyogrio is the GDAL-backed vectorized reader.
         """
-        self.subzone_data = gpd.read_file(subzone_data_path)
-        self.subzone_data = self.subzone_data.set_crs(crs, allow_override=True)
+        self.geo_engine = geo_engine
+        self.subzone_data = self._load_subzones(subzone_data_path, crs)
+        self.geocode_cache_path = Path(raw_preschool_data_path).with_name(
+            "postal_geocode_cache.json"
+        )
+        self.postal_lookup = self._load_postal_lookup(postal_lookup_path)
+
+        if processed_preschool_data_path is not None:
+            processed_preschool_data_path = Path(processed_preschool_data_path)
+            # Prefer the typed, columnar parquet artifact over the CSV; CSV is
+            # kept as a fallback for data directories written by older runs
+            parquet_path = processed_preschool_data_path.with_suffix(".parquet")
+            if parquet_path.exists():
+                processed_preschool_data_path = parquet_path
 
         if (
             processed_preschool_data_path is not None
-            and Path(processed_preschool_data_path).exists()
+            and processed_preschool_data_path.exists()
         ):
             print("Preprocessed preschool data found, skipping preprocessing")
             print(
                 f"Loading preprocessed preschool data from {processed_preschool_data_path}"
             )
-            self.processed_preschool_data = pd.read_csv(processed_preschool_data_path)
+            if processed_preschool_data_path.suffix == ".parquet":
+                self.processed_preschool_data = pd.read_parquet(
+                    processed_preschool_data_path
+                )
+            else:
+                self.processed_preschool_data = pd.read_csv(
+                    processed_preschool_data_path
+                )
             self.raw_preschool_data = None
         else:
             print("No preprocessed preschool data found")
@@ -51,22 +96,106 @@ class PreschoolProcessor:
             self.raw_preschool_data = pd.read_csv(raw_preschool_data_path)
             self.processed_preschool_data = None
 
+    def _load_subzones(
+        self, subzone_data_path: Union[str, Path], crs: str
+    ) -> gpd.GeoDataFrame:
+        """
+        Loads the subzone boundaries, using a GeoParquet sidecar cache.
+
+        Parsing the Master Plan GeoJSON and rebuilding geometries dominates
+        cold start, so the parsed (and subzone-name-cleaned) GeoDataFrame is
+        cached as parquet next to the GeoJSON and reused while it is newer
+        than the source.
+
+        Args:
+            subzone_data_path: The path to GEOJSON file containing subzone geolocation definitions.
+            crs: The coordinate reference system of the subzone data.
+
+        Returns:
+            GeoDataFrame of subzone polygons with a clean 'subzone' column.
+        """
+        geojson_path = Path(subzone_data_path)
+        cache_path = geojson_path.with_suffix(".parquet")
+
+        if (
+            cache_path.exists()
+            and cache_path.stat().st_mtime >= geojson_path.stat().st_mtime
+        ):
+            print(f"Loading cached subzone data from {cache_path}")
+            # GeoParquet persists whatever CRS was active at write time;
+            # re-apply the configured CRS so cache hits honour it the same
+            # way the cold path does
+            return gpd.read_parquet(cache_path).set_crs(crs, allow_override=True)
+
+        print(f"Loading subzone data from {geojson_path}")
+        try:
+            subzone_data = gpd.read_file(geojson_path, engine=self.geo_engine)
+        except ImportError:
+            subzone_data = gpd.read_file(geojson_path)
+        subzone_data = subzone_data.set_crs(crs, allow_override=True)
+        subzone_data = self.clean_subzone_names(subzone_data)
+        try:
+            subzone_data.to_parquet(cache_path)
+        except (ImportError, OSError):
+            # No parquet engine or read-only data directory; just skip caching
+            pass
+        return subzone_data
+
+    @staticmethod
+    def _load_postal_lookup(
+        postal_lookup_path: Optional[Union[str, Path]],
+    ) -> dict:
+        """
+        Loads a local postal-code-to-(lat, lon) lookup table, if configured.
+
+        Returns:
+            Dict mapping int postal code to a (lat, lon) tuple; empty if no
+            table is configured or present.
+        """
+        if postal_lookup_path is None or not Path(postal_lookup_path).exists():
+            return {}
+        print(f"Loading postal code lookup table from {postal_lookup_path}")
+        lookup_table = pd.read_parquet(postal_lookup_path)
+        return dict(
+            zip(
+                lookup_table["postal_code"].astype(int),
+                zip(lookup_table["lat"], lookup_table["lon"]),
+            )
+        )
+
     def get_latlon_from_postal(
-        self, postal_code: int
+        self,
+        postal_code: int,
+        session: Optional[requests.Session] = None,
+        max_retries: int = 3,
     ) -> Tuple[Optional[float], Optional[float]]:
         """
         Query OneMap's Search API to convert a 6-digit Singapore postal code
         into (latitude, longitude).
 
+        Args:
+            postal_code: The postal code to geocode.
+            session: Optional requests Session to reuse connections across calls.
+            max_retries: Number of attempts for rate-limited or server errors.
+
         Returns:
             (lat, lon) as floats, or None if no result is found.
         """
         postal_code = str(postal_code)
         url = f"https://www.onemap.gov.sg/api/common/elastic/search?searchVal={postal_code}&returnGeom=Y&getAddrDetails=Y&pageNum=1"
         headers = {"Authorization": "Bearer **********************"}
-        response = requests.get(url, headers=headers).json()
+        client = session if session is not None else requests
 
         try:
+            for attempt in range(max_retries):
+                raw_response = client.get(url, headers=headers, timeout=30)
+                # Back off and retry on rate limiting or server errors
+                if raw_response.status_code == 429 or raw_response.status_code >= 500:
+                    time.sleep(2**attempt)
+                    continue
+                break
+            response = raw_response.json()
+
             # Get first result
             if int(response["found"]) > 0:
                 result = response["results"][0]
@@ -78,23 +207,83 @@ class PreschoolProcessor:
             print(f"Error getting latlon from postal code {postal_code}: {e}")
             return None, None
 
+    def _load_geocode_cache(self) -> dict:
+        """Load the postal-code geocode cache, or an empty dict if absent."""
+        if self.geocode_cache_path.exists():
+            try:
+                return json.loads(self.geocode_cache_path.read_text())
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _save_geocode_cache(self, geocode_cache: dict) -> None:
+        """Persist the postal-code geocode cache, ignoring write failures."""
+        try:
+            self.geocode_cache_path.write_text(json.dumps(geocode_cache))
+        except OSError:
+            pass
+
     def get_preschool_latlon(self, preschool_data: pd.DataFrame) -> pd.DataFrame:
         """
         Get the latitude and longitude of all preschools.
 
+        Codes present in the local postal lookup table are resolved without
+        any network work; the rest are geocoded concurrently over a pooled
+        HTTP session (the work is pure network I/O), with results cached on
+        disk so reruns skip the API.
+
         Args:
             preschool_data: DataFrame containing preschool postal code in "postal_code" column
 
         Returns:
             DataFrame: preschool_data with new 'latitude' and 'longitude' columns
         """
-        print(
-            f"Calling OneMap API for {len(preschool_data)} instances, this may take a while..."
-        )
-        preschool_data["latitude"], preschool_data["longitude"] = zip(
-            *preschool_data.apply(
-                lambda x: self.get_latlon_from_postal(int(x["postal_code"])), axis=1
+        postal_codes = preschool_data["postal_code"].astype(int)
+        unique_codes = postal_codes.unique()
+        geocode_cache = self._load_geocode_cache()
+        missing_codes = [
+            code
+            for code in unique_codes
+            if code not in self.postal_lookup and str(code) not in geocode_cache
+        ]
+
+        if missing_codes:
+            print(
+                f"Calling OneMap API for {len(missing_codes)} unique postal codes..."
             )
+            max_workers = min(32, len(missing_codes))
+            session = requests.Session()
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=max_workers, pool_maxsize=max_workers
+                ),
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda code: self.get_latlon_from_postal(code, session),
+                    missing_codes,
+                )
+            for code, latlon in zip(missing_codes, results):
+                geocode_cache[str(code)] = latlon
+            self._save_geocode_cache(geocode_cache)
+        else:
+            print("All postal codes resolved locally, skipping OneMap API")
+
+        # Fill preallocated float arrays so the coordinate columns land as
+        # float64 with NaN for failed geocodes, never object dtype
+        unique_lats = np.full(len(unique_codes), np.nan, dtype=np.float64)
+        unique_lons = np.full(len(unique_codes), np.nan, dtype=np.float64)
+        for i, code in enumerate(unique_codes):
+            latlon = self.postal_lookup.get(code) or geocode_cache[str(code)]
+            if latlon is not None and latlon[0] is not None:
+                unique_lats[i] = latlon[0]
+                unique_lons[i] = latlon[1]
+        preschool_data["latitude"] = postal_codes.map(
+            pd.Series(unique_lats, index=unique_codes)
+        )
+        preschool_data["longitude"] = postal_codes.map(
+            pd.Series(unique_lons, index=unique_codes)
         )
         return preschool_data
 
@@ -118,30 +307,14 @@ class PreschoolProcessor:
         Returns:
             str: Cleaned subzone name in title case
         """
-        # Pattern to match the SUBZONE_N row in the HTML table
-        # Looks for: <th>SUBZONE_N</th> <td>SUBZONE_NAME</td>
-        pattern = r"<th>SUBZONE_N<\/th>\s*<td>([^<]+)<\/td>"
-
-        match = re.search(pattern, description_html)
+        match = _SUBZONE_PATTERN.search(description_html)
 
         if match:
-            # Extract the subzone name
-            subzone_name = match.group(1)
-
-            # Unescape any HTML entities (though there shouldn't be any in this case)
-            subzone_name = html.unescape(subzone_name)
-
-            # Convert from ALL CAPS to Title Case
-            subzone_name_clean = subzone_name.title()
-
-            return subzone_name_clean
+            # Unescape any HTML entities (though there shouldn't be any in this
+            # case) and convert from ALL CAPS to Title Case
+            return _unescape_if_needed(match.group(1)).title()
         else:
-            # Fallback: try to extract any text that looks like a subzone name
-            # This handles cases where the HTML structure might be slightly different
-            fallback_pattern = r"SUBZONE_N.*?<td>([^<]+)<\/td>"
-            fallback_match = re.search(
-                fallback_pattern, description_html, re.IGNORECASE
-            )
+            fallback_match = _SUBZONE_FALLBACK_PATTERN.search(description_html)
 
             if fallback_match:
                 return fallback_match.group(1).title()
@@ -158,8 +331,19 @@ class PreschoolProcessor:
         Returns:
             GeoDataFrame: Original data with new 'subzone_name_clean' column
         """
-        # Extract clean subzone names
-        gdf["subzone"] = gdf["Description"].apply(self.extract_subzone_name)
+        # Extract clean subzone names in one vectorized pass, only falling
+        # back to the looser pattern for rows the primary one misses
+        names = gdf["Description"].str.extract(_SUBZONE_PATTERN, expand=False)
+        unmatched = names.isna()
+        if unmatched.any():
+            names.update(
+                gdf.loc[unmatched, "Description"].str.extract(
+                    _SUBZONE_FALLBACK_PATTERN, expand=False
+                )
+            )
+        gdf["subzone"] = (
+            names.fillna("Unknown Subzone").map(_unescape_if_needed).str.title()
+        )
 
         return gdf
 
@@ -182,23 +366,41 @@ class PreschoolProcessor:
         Returns:
             GeoDataFrame: subzones_data with new 'num_childcare_centres' column
         """
-        # Initialize column to count childcare centres per subzone
-        subzone_data["num_preschools"] = 0
-
-        # Process each childcare centre
-        for _, preschool in preschool_data.iterrows():
-            # Skip if no lat/lon available
-            if pd.isna(preschool.latitude) or pd.isna(preschool.longitude):
-                continue
-
-            # Create point geometry from lat/lon
-            point = Point(preschool.longitude, preschool.latitude)
+        # Filter to preschools with known coordinates on the raw arrays, then
+        # build point geometries and project them to the subzone CRS in one
+        # vectorized transform, rather than leaving any conversion to happen
+        # per point inside the predicate
+        longitudes = preschool_data["longitude"].to_numpy(dtype=np.float64)
+        latitudes = preschool_data["latitude"].to_numpy(dtype=np.float64)
+        located = np.isfinite(longitudes) & np.isfinite(latitudes)
+        preschool_points = gpd.GeoSeries(
+            gpd.points_from_xy(longitudes[located], latitudes[located]),
+            crs="EPSG:4326",
+        ).to_crs(subzone_data.crs)
+
+        # Cull points outside the overall subzone bounding box with one
+        # vectorized comparison before they ever reach the spatial index
+        min_x, min_y, max_x, max_y = subzone_data.total_bounds
+        point_x = preschool_points.x.to_numpy()
+        point_y = preschool_points.y.to_numpy()
+        in_bounds = (
+            (point_x >= min_x)
+            & (point_x <= max_x)
+            & (point_y >= min_y)
+            & (point_y <= max_y)
+        )
+        preschool_points = preschool_points[in_bounds]
+
+        # Query a spatial index over the subzone polygons in one batch; each
+        # within-pair comes back as (point position, subzone position), so the
+        # counts reduce to a bincount over the subzone positions
+        tree = STRtree(subzone_data.geometry.values)
+        _, subzone_positions = tree.query(
+            preschool_points.values, predicate="within"
+        )
+        counts = np.bincount(subzone_positions, minlength=len(subzone_data))
 
-            # Find which subzone contains this point
-            for idx, subzone in subzone_data.iterrows():
-                if point.within(subzone.geometry):
-                    subzone_data.loc[idx, "num_preschools"] += 1
-                    break
+        subzone_data["num_preschools"] = counts.astype(np.int32)
 
         return subzone_data
 
@@ -209,15 +411,27 @@ class PreschoolProcessor:
         if self.processed_preschool_data is None:
             # Process raw data: add lat/lon to preschools
             preschool_data = self.get_preschool_latlon(self.raw_preschool_data)
-            # Save raw preschool data with lat/lon for future use
-            preschool_data.to_csv(Path("data/preschools_data_processed.csv"), index=False)
+            # Save raw preschool data with lat/lon for future use; parquet
+            # keeps dtypes and avoids re-parsing text on the next run
+            try:
+                preschool_data.to_parquet(
+                    Path("data/preschools_data_processed.parquet"),
+                    index=False,
+                    compression="zstd",
+                )
+            except ImportError:
+                preschool_data.to_csv(
+                    Path("data/preschools_data_processed.csv"), index=False
+                )
             self.compute_missing_latlon_pct(preschool_data)
         else:
             # Use existing processed preschool data
             preschool_data = self.processed_preschool_data
         
         # Always perform subzone aggregation (this is what we actually want to return)
-        self.subzone_data = self.clean_subzone_names(self.subzone_data)
+        # Subzone names were already cleaned when the boundaries were loaded
+        if "subzone" not in self.subzone_data.columns:
+            self.subzone_data = self.clean_subzone_names(self.subzone_data)
         # self.subzone_data = self.drop_subzone_columns(self.subzone_data)
         subzone_with_counts = self.count_childcare_centres_per_subzone(
             self.subzone_data, preschool_data
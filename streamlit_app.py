@@ -1,11 +1,20 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import plotly.express as px
 import plotly.graph_objects as go
+import hashlib
 import tempfile
 import json
 from pathlib import Path
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 import folium
-from streamlit_folium import st_folium
+import geopandas as gpd
+import pandas as pd
+from streamlit_folium import folium_static
 
 # Import our forecast system
 from src.forecast import Forecaster, Config
@@ -136,6 +145,14 @@ def setup_configuration_panel():
         help="CRS for geographic data processing"
     )
 
+    geo_engine = st.selectbox(
+        "GeoJSON reader engine",
+        options=["pyogrio", "fiona"],
+        index=0,
+        help="pyogrio is the GDAL-backed vectorized reader and is much faster "
+             "for the Master Plan boundary file"
+    )
+
     # Create config object
     config = Config(
         num_forecast_years=num_forecast_years,
@@ -144,7 +161,8 @@ def setup_configuration_panel():
         max_preschool_age=max_preschool_age,
         sheet_name=sheet_name,
         header_row=header_row,
-        crs=crs
+        crs=crs,
+        geo_engine=geo_engine
     )
 
     return config
@@ -271,9 +289,111 @@ def validate_inputs(uploaded_files):
         return all(uploaded_files.get(key) is not None for key in required_files)
 
 
-@st.cache_data
+def _digest_bytes(buffer):
+    """Digest a buffer with xxh3 (multi-GB/s) or blake2b if unavailable."""
+    if xxhash is not None:
+        return xxhash.xxh3_128(buffer).hexdigest()
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
+
+
+def _digest_upload(uploaded_file):
+    """Digest an uploaded file, memoized per upload within the session.
+
+    Streamlit keeps a stable file_id per upload, so the bytes of an
+    unchanged upload are only scanned once rather than on every rerun.
+    """
+    digests = st.session_state.setdefault('_upload_digests', {})
+    file_id = getattr(uploaded_file, 'file_id', None)
+    if file_id is not None and file_id in digests:
+        return digests[file_id]
+    digest = _digest_bytes(uploaded_file.getbuffer())
+    if file_id is not None:
+        digests[file_id] = digest
+    return digest
+
+
+def _persist_uploaded_file(uploaded_file, filename):
+    """Write an uploaded file to a content-addressed path, once.
+
+    The path is keyed by a digest of the file bytes, so reruns with the
+    same upload reuse the file already on disk instead of re-serializing
+    it into a fresh temporary directory.
+    """
+    digest = _digest_upload(uploaded_file)
+    target = Path(tempfile.gettempdir()) / "ecda_uploads" / digest / filename
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(uploaded_file.getbuffer())
+    return target
+
+
+def _input_fingerprints(uploaded_files):
+    """Build a hashable fingerprint of the input files for cache keying.
+
+    Default files are keyed on (path, mtime, size); uploaded buffers are
+    keyed on a digest of their bytes so re-uploads of changed files still
+    invalidate the cache.
+    """
+    fingerprints = []
+    for key in sorted(k for k in uploaded_files if k != 'use_defaults'):
+        value = uploaded_files[key]
+        if value is None:
+            fingerprints.append((key, None))
+        elif isinstance(value, (str, Path)):
+            stat = Path(value).stat()
+            fingerprints.append((key, str(value), stat.st_mtime_ns, stat.st_size))
+        else:
+            fingerprints.append((key, _digest_upload(value)))
+    return tuple(fingerprints)
+
+
 def run_forecast_analysis(config, uploaded_files):
-    """Run the forecast analysis with caching."""
+    """Run the forecast analysis with caching.
+
+    Results are cached by reference (st.cache_resource), so reruns from the
+    year slider or tab switches reuse the same DataFrames instead of paying
+    a pickle round-trip per hit; the cache key is built explicitly from the
+    config fields and input-file fingerprints.
+    """
+    try:
+        cache_key = (
+            config.num_forecast_years,
+            config.preschool_capacity,
+            config.min_preschool_age,
+            config.max_preschool_age,
+            config.sheet_name,
+            config.header_row,
+            config.crs,
+            _input_fingerprints(uploaded_files),
+        )
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None:
+        return _run_forecast_cached(cache_key, config, uploaded_files)
+    return _run_forecast(config, uploaded_files)
+
+
+@st.cache_resource(max_entries=4, ttl=24 * 60 * 60)
+def _run_forecast_cached(cache_key, _config, _uploaded_files):
+    """Cached wrapper; cache_key carries all invalidation information."""
+    if _uploaded_files.get('use_defaults', False):
+        # Default files never change between process restarts, so their
+        # results are additionally persisted to disk; the fingerprint in
+        # cache_key includes file mtimes, so edits still invalidate
+        return _run_forecast_persisted(cache_key, _config, _uploaded_files)
+    return _run_forecast(_config, _uploaded_files)
+
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=4)
+def _run_forecast_persisted(cache_key, _config, _uploaded_files):
+    """Disk-persisted wrapper so default-file runs survive cold starts."""
+    return _run_forecast(_config, _uploaded_files)
+
+
+def _run_forecast(config, uploaded_files):
+    """Run the forecast analysis."""
     try:
         if uploaded_files.get('use_defaults', False):
             # Use default files directly
@@ -289,49 +409,32 @@ def run_forecast_analysis(config, uploaded_files):
                 )
             }
         else:
-            # Create temporary directory for uploaded files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_dir_path = Path(temp_dir)
-
-                # Save uploaded files to temporary location
-                file_paths = {}
-
-                # Save fertility data
-                fertility_path = temp_dir_path / "fertility_data.csv"
-                with open(fertility_path, "wb") as f:
-                    f.write(uploaded_files['fertility_data'].getbuffer())
-                file_paths['fertility_data_path'] = fertility_path
-
-                # Save BTO data
-                bto_path = temp_dir_path / "bto_data.csv"
-                with open(bto_path, "wb") as f:
-                    f.write(uploaded_files['bto_data'].getbuffer())
-                file_paths['bto_data_path'] = bto_path
-
-                # Save existing residents data
-                existing_residents_path = temp_dir_path / "existing_residents.xlsx"
-                with open(existing_residents_path, "wb") as f:
-                    f.write(uploaded_files['existing_residents'].getbuffer())
-                file_paths['existing_residents_path'] = existing_residents_path
-
-                # Save subzone data
-                subzone_path = temp_dir_path / "subzone_data.geojson"
-                with open(subzone_path, "wb") as f:
-                    f.write(uploaded_files['subzone_data'].getbuffer())
-                file_paths['subzone_data_path'] = subzone_path
-
-                # Save preschool data
-                preschool_path = temp_dir_path / "preschool_data.csv"
-                with open(preschool_path, "wb") as f:
-                    f.write(uploaded_files['preschool_data'].getbuffer())
-                file_paths['raw_preschool_data_path'] = preschool_path
-
-                # Handle optional processed preschool data
-                if uploaded_files.get('processed_preschool'):
-                    processed_path = temp_dir_path / "processed_preschool_data.csv"
-                    with open(processed_path, "wb") as f:
-                        f.write(uploaded_files['processed_preschool'].getbuffer())
-                    file_paths['processed_preschool_data_path'] = processed_path
+            # Persist uploaded files once, keyed by content hash, so reruns
+            # with unchanged uploads skip the writes entirely
+            file_paths = {
+                'fertility_data_path': _persist_uploaded_file(
+                    uploaded_files['fertility_data'], "fertility_data.csv"
+                ),
+                'bto_data_path': _persist_uploaded_file(
+                    uploaded_files['bto_data'], "bto_data.csv"
+                ),
+                'existing_residents_path': _persist_uploaded_file(
+                    uploaded_files['existing_residents'], "existing_residents.xlsx"
+                ),
+                'subzone_data_path': _persist_uploaded_file(
+                    uploaded_files['subzone_data'], "subzone_data.geojson"
+                ),
+                'raw_preschool_data_path': _persist_uploaded_file(
+                    uploaded_files['preschool_data'], "preschool_data.csv"
+                ),
+            }
+
+            # Handle optional processed preschool data
+            if uploaded_files.get('processed_preschool'):
+                file_paths['processed_preschool_data_path'] = _persist_uploaded_file(
+                    uploaded_files['processed_preschool'],
+                    "processed_preschool_data.csv",
+                )
 
         # Update config with file paths
         updated_config = Config(
@@ -346,6 +449,7 @@ def run_forecast_analysis(config, uploaded_files):
             header_row=config.header_row,
             subzone_data_path=file_paths['subzone_data_path'],
             crs=config.crs,
+            geo_engine=config.geo_engine,
             raw_preschool_data_path=file_paths['raw_preschool_data_path'],
             processed_preschool_data_path=file_paths.get('processed_preschool_data_path')
         )
@@ -367,8 +471,24 @@ def run_forecast_analysis(config, uploaded_files):
         return None
 
 
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _yearly_totals(forecast_frame):
+    """Sum a (year x subzone) frame across subzones, memoized by identity.
+
+    The forecast frames are cached by reference, so each one is reduced once
+    and every slider tick afterwards is an O(1) scalar lookup.
+    """
+    return forecast_frame.sum(axis=1)
+
+
+@st.fragment
 def display_forecast_results():
-    """Display the forecast results with interactive visualization."""
+    """Display the forecast results with interactive visualization.
+
+    Runs as a fragment: year-slider and view changes rerun only this
+    function instead of the whole script, so the sidebar and upload
+    widgets are not rebuilt per interaction.
+    """
     results = st.session_state.forecast_results
 
     if not results:
@@ -390,11 +510,11 @@ def display_forecast_results():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_preschoolers = results['forecasted_preschoolers'].loc[selected_year].sum()
+        total_preschoolers = _yearly_totals(results['forecasted_preschoolers']).at[selected_year]
         st.metric("Total Projected Preschoolers", f"{total_preschoolers:,.0f}")
 
     with col2:
-        total_needed = results['forecasted_preschools_needed'].loc[selected_year].sum()
+        total_needed = _yearly_totals(results['forecasted_preschools_needed']).at[selected_year]
         st.metric("Total Preschools Needed", f"{total_needed:,.0f}")
 
     with col3:
@@ -402,7 +522,7 @@ def display_forecast_results():
         st.metric("Current Preschools", f"{current_preschools:,.0f}")
 
     with col4:
-        total_gap = results['preschool_gap'].loc[selected_year].sum()
+        total_gap = _yearly_totals(results['preschool_gap']).at[selected_year]
         gap_color = "inverse" if total_gap < 0 else "normal"
         st.metric("Overall Gap", f"{total_gap:,.0f}", delta_color=gap_color)
 
@@ -411,36 +531,38 @@ def display_forecast_results():
 
     try:
         # Prepare mapping data for selected year
-        map_data = prepare_mapping_data_merge(
+        map_data = _prepare_mapping_data(
             results['existing_preschools'],
             results['forecasted_preschoolers'],
             results['forecasted_preschools_needed'],
             results['preschool_gap'],
-            year=selected_year
+            selected_year
         )
 
-        # Create tabs for different views
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "Current Supply",
-            "Projected Demand",
-            "Preschools Needed",
-            "Shortage Areas"
-        ])
+        # Let the user pick one view; st.tabs would execute all four map
+        # builds on every rerun even though only one is visible
+        selected_view = st.radio(
+            "View",
+            options=[
+                "Current Supply",
+                "Projected Demand",
+                "Preschools Needed",
+                "Shortage Areas"
+            ],
+            horizontal=True
+        )
 
-        with tab1:
+        if selected_view == "Current Supply":
             create_choropleth_map(map_data, 'num_preschools',
                                   'Current Preschools', 'Blues')
-
-        with tab2:
+        elif selected_view == "Projected Demand":
             create_choropleth_map(map_data, 'projected_preschoolers',
                                   f'Projected Preschoolers ({selected_year})',
                                   'Oranges')
-
-        with tab3:
+        elif selected_view == "Preschools Needed":
             create_choropleth_map(map_data, 'preschools_needed',
                                   f'Preschools Needed ({selected_year})', 'Reds')
-
-        with tab4:
+        else:
             create_shortage_map(map_data, selected_year)
 
     except Exception as e:
@@ -449,95 +571,87 @@ def display_forecast_results():
         st.dataframe(map_data.head())
 
 
+def _find_subzone_key(geojson):
+    """Find the GeoJSON property naming the subzone.
+
+    The detected key is kept in session_state so repeat renders skip the
+    scan, but it is only trusted if it actually exists in the current
+    features: the choropleth and shortage maps serialize differently shaped
+    frames (reset-index vs indexed), so a key cached from one schema may be
+    absent from the other.
+    """
+    features = geojson.get('features', [])
+    available_props = features[0].get('properties', {}) if features else {}
+
+    key_to_use = st.session_state.get('geo_key')
+    if key_to_use is not None and key_to_use in available_props:
+        return key_to_use
+
+    for key in ('subzone_name_clean', 'subzone', 'SUBZONE_N', 'Name'):
+        if key in available_props:
+            st.session_state['geo_key'] = key
+            return key
+    return None
+
+
+@st.cache_resource(show_spinner=False, max_entries=16, hash_funcs={gpd.GeoDataFrame: id})
+def _to_geojson(gdf):
+    """Serialize a GeoDataFrame to a GeoJSON dict once per frame.
+
+    Every folium layer fed from __geo_interface__ re-walks and re-serializes
+    all geometries; going through to_json uses shapely's C serializer and the
+    result is memoized by frame identity so each map render pays for it once.
+
+    Only pass frames whose identity is stable across reruns (i.e. frames held
+    by a cache_resource layer upstream): entries are keyed by id(), so a
+    frame rebuilt per call would pin a stale entry that a later allocation at
+    the same address could collide with. Ephemeral frames should be
+    serialized directly with gdf.to_json() instead.
+    """
+    return json.loads(gdf.to_json())
+
+
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=16,
+    hash_funcs={gpd.GeoDataFrame: id, pd.DataFrame: id},
+)
+def _prepare_mapping_data(existing, preschoolers, needed, gap, year):
+    """Build the mapping frame, memoized per (inputs, year).
+
+    cache_resource (not cache_data) is deliberate: it hands back the same
+    object on every hit instead of a pickled copy, so the downstream GeoJSON
+    and HTML caches keyed on the frame's identity can actually hit. The
+    frame is treated as read-only by every consumer.
+    """
+    return prepare_mapping_data_merge(existing, preschoolers, needed, gap, year=year)
+
+
 def create_choropleth_map(map_data, column, title, colorscale):
     """Create a choropleth map using Folium."""
     try:
         st.subheader(title)
-        
+
         # Check if we have geometry data
         if 'geometry' not in map_data.columns:
             st.warning("No geometry data available. Showing bar chart instead.")
             create_fallback_chart(map_data, column, title, colorscale)
             return
-        
-        # Reset index to get subzone names as a column if needed
-        if map_data.index.name == 'subzone_name_clean':
-            plot_data = map_data.reset_index()
-        else:
-            plot_data = map_data.copy()
-        
-        # Create folium map centered on Singapore
-        singapore_center = [1.3521, 103.8198]
-        m = folium.Map(location=singapore_center, zoom_start=11, tiles='OpenStreetMap')
-        
-        # Find the correct key for subzone names in GeoJSON properties
-        if len(plot_data) > 0:
-            first_feature = plot_data.__geo_interface__['features'][0] if plot_data.__geo_interface__['features'] else {}
-            available_props = list(first_feature.get('properties', {}).keys())
-            
-            # Try to find the correct key for subzone names
-            possible_keys = ['subzone_name_clean', 'subzone', 'SUBZONE_N', 'Name']
-            key_to_use = None
-            for key in possible_keys:
-                if key in available_props:
-                    key_to_use = key
-                    break
-            
-            if key_to_use:
-                # Add choropleth layer
-                folium.Choropleth(
-                    geo_data=plot_data.__geo_interface__,
-                    name=title,
-                    data=plot_data.reset_index(),
-                    columns=['subzone_name_clean', column],
-                    key_on=f'feature.properties.{key_to_use}',
-                    fill_color=get_folium_colorscale(colorscale),
-                    fill_opacity=0.7,
-                    line_opacity=0.2,
-                    legend_name=title
-                ).add_to(m)
-            else:
-                # Fallback to manual styling
-                def style_function(feature):
-                    return {
-                        'fillColor': 'blue',
-                        'color': 'black',
-                        'weight': 1,
-                        'fillOpacity': 0.7
-                    }
-                
-                folium.GeoJson(
-                    plot_data.__geo_interface__,
-                    style_function=style_function
-                ).add_to(m)
-        
-        # Add tooltips
-        folium.GeoJson(
-            plot_data.__geo_interface__,
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': 'black',
-                'weight': 1,
-                'fillOpacity': 0
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['subzone_name_clean', column],
-                aliases=['Subzone:', f'{title}:'],
-                localize=True
-            )
-        ).add_to(m)
-        
-        # Display the map
-        st_folium(m, width=700, height=500)
-        
+
+        # The map is read-only and deterministic for a given frame and
+        # column, so render it to HTML once and serve repeat visits to the
+        # same view from the cache
+        map_html = _render_choropleth_html(map_data, column, title, colorscale)
+        components.html(map_html, width=700, height=500)
+
         # Show summary statistics
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total", f"{plot_data[column].sum():,.0f}")
+            st.metric("Total", f"{map_data[column].sum():,.0f}")
         with col2:
-            st.metric("Average", f"{plot_data[column].mean():.1f}")
+            st.metric("Average", f"{map_data[column].mean():.1f}")
         with col3:
-            st.metric("Max", f"{plot_data[column].max():,.0f}")
+            st.metric("Max", f"{map_data[column].max():,.0f}")
 
     except Exception as e:
         st.error(f"Error creating map: {str(e)}")
@@ -545,6 +659,69 @@ def create_choropleth_map(map_data, column, title, colorscale):
         create_fallback_chart(map_data, column, title, colorscale)
 
 
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={gpd.GeoDataFrame: id})
+def _render_choropleth_html(map_data, column, title, colorscale):
+    """Build the choropleth and return its static HTML, cached per view."""
+    # Reset index to get subzone names as a column if needed; everything
+    # below only reads plot_data, so no defensive copy is taken. The reset
+    # frame is rebuilt on every call, so it must not go through the
+    # identity-keyed _to_geojson cache; the surrounding HTML cache already
+    # makes its serialization a cold-path cost
+    if map_data.index.name == 'subzone_name_clean':
+        plot_data = map_data.reset_index()
+        plot_geojson = json.loads(plot_data.to_json())
+    else:
+        plot_data = map_data
+        plot_geojson = _to_geojson(plot_data)
+
+    # Create folium map centered on Singapore
+    singapore_center = [1.3521, 103.8198]
+    m = folium.Map(location=singapore_center, zoom_start=11, tiles='OpenStreetMap')
+
+    tooltip = folium.GeoJsonTooltip(
+        fields=['subzone_name_clean', column],
+        aliases=['Subzone:', f'{title}:'],
+        localize=True
+    )
+
+    # Find the correct key for subzone names in GeoJSON properties
+    if len(plot_data) > 0:
+        key_to_use = _find_subzone_key(plot_geojson)
+
+        if key_to_use:
+            # Add choropleth layer, hanging the tooltip off its geojson child
+            # so no second full-geometry layer is serialized just for hover
+            choropleth = folium.Choropleth(
+                geo_data=plot_geojson,
+                name=title,
+                data=plot_data,
+                columns=['subzone_name_clean', column],
+                key_on=f'feature.properties.{key_to_use}',
+                fill_color=get_folium_colorscale(colorscale),
+                fill_opacity=0.7,
+                line_opacity=0.2,
+                legend_name=title
+            ).add_to(m)
+            choropleth.geojson.add_child(tooltip)
+        else:
+            # Fallback to manual styling
+            def style_function(feature):
+                return {
+                    'fillColor': 'blue',
+                    'color': 'black',
+                    'weight': 1,
+                    'fillOpacity': 0.7
+                }
+
+            folium.GeoJson(
+                plot_geojson,
+                style_function=style_function,
+                tooltip=tooltip
+            ).add_to(m)
+
+    return m.get_root().render()
+
+
 def create_fallback_chart(map_data, column, title, colorscale):
     """Create a fallback bar chart when map creation fails."""
     try:
@@ -600,9 +777,13 @@ def create_shortage_map(map_data, year):
                 singapore_center = [1.3521, 103.8198]
                 m = folium.Map(location=singapore_center, zoom_start=11, tiles='OpenStreetMap')
                 
+                # Serialize the frame to GeoJSON once and feed every layer
+                # from it
+                map_geojson = _to_geojson(map_data)
+
                 # Add base layer for all subzones (light gray)
                 folium.GeoJson(
-                    map_data.__geo_interface__,
+                    map_geojson,
                     style_function=lambda x: {
                         'fillColor': 'lightgray',
                         'color': 'white',
@@ -611,31 +792,25 @@ def create_shortage_map(map_data, year):
                     }
                 ).add_to(m)
                 
-                # Prepare shortage data for choropleth - ensure proper structure
-                shortage_reset = shortage_data.reset_index()
+                # Precompute an O(1) shortage lookup so the per-feature style
+                # and tooltip callbacks don't scan the DataFrame per subzone;
+                # the frame is already indexed by subzone name
+                shortage_series = shortage_data['shortage']
+                shortage_by_subzone = shortage_series.to_dict()
+                max_shortage = shortage_series.max()
                 
                 # Try choropleth approach first
                 try:
                     # Find the correct key for subzone names in GeoJSON properties
                     if len(map_data) > 0:
-                        first_feature = map_data.__geo_interface__['features'][0]
-                        available_props = list(first_feature.get('properties', {}).keys())
-                        
-                        # Try to find the correct key for subzone names
-                        possible_keys = ['subzone_name_clean', 'subzone', 'SUBZONE_N', 'Name']
-                        key_to_use = None
-                        for key in possible_keys:
-                            if key in available_props:
-                                key_to_use = key
-                                break
-                        
+                        key_to_use = _find_subzone_key(map_geojson)
+
                         if key_to_use:
                             # Use choropleth with proper key mapping
                             folium.Choropleth(
-                                geo_data=map_data.__geo_interface__,
+                                geo_data=map_geojson,
                                 name='Shortage Areas',
-                                data=shortage_reset,
-                                columns=['subzone_name_clean', 'shortage'],
+                                data=shortage_series,
                                 key_on=f'feature.properties.{key_to_use}',
                                 fill_color='Reds',
                                 fill_opacity=0.8,
@@ -651,10 +826,10 @@ def create_shortage_map(map_data, year):
                     # Fallback: Manual styling of shortage areas
                     def style_function(feature):
                         subzone_name = feature.get('properties', {}).get('subzone_name_clean', '')
-                        if subzone_name in shortage_reset['subzone_name_clean'].values:
-                            shortage_val = shortage_reset[shortage_reset['subzone_name_clean'] == subzone_name]['shortage'].iloc[0]
+                        shortage_val = shortage_by_subzone.get(subzone_name)
+                        if shortage_val is not None:
                             # Scale color intensity based on shortage
-                            intensity = min(1.0, shortage_val / shortage_reset['shortage'].max())
+                            intensity = min(1.0, shortage_val / max_shortage)
                             return {
                                 'fillColor': f'rgba(255, {int(255*(1-intensity))}, {int(255*(1-intensity))}, 0.8)',
                                 'color': 'darkred',
@@ -669,33 +844,44 @@ def create_shortage_map(map_data, year):
                         }
                     
                     folium.GeoJson(
-                        map_data.__geo_interface__,
+                        map_geojson,
                         style_function=style_function
                     ).add_to(m)
                 
                 # Add tooltips for shortage areas only
                 def get_tooltip_data(feature):
                     subzone_name = feature.get('properties', {}).get('subzone_name_clean', '')
-                    if subzone_name in shortage_reset['subzone_name_clean'].values:
-                        shortage_val = shortage_reset[shortage_reset['subzone_name_clean'] == subzone_name]['shortage'].iloc[0]
+                    shortage_val = shortage_by_subzone.get(subzone_name)
+                    if shortage_val is not None:
                         return f"<b>{subzone_name}</b><br/>Shortage: {shortage_val:.0f} preschools"
                     return None
                 
-                for _, row in shortage_reset.iterrows():
-                    if hasattr(row, 'geometry') and row.geometry is not None:
-                        folium.GeoJson(
-                            row.geometry.__geo_interface__,
-                            tooltip=f"<b>{row['subzone_name_clean']}</b><br/>Shortage: {row['shortage']:.0f} preschools",
-                            style_function=lambda x: {
-                                'fillColor': 'transparent',
-                                'color': 'darkred',
-                                'weight': 2,
-                                'fillOpacity': 0
-                            }
-                        ).add_to(m)
+                # One combined layer for all shortage outlines; a per-row
+                # GeoJson loop would emit one Leaflet layer per subzone and
+                # bloat the rendered page. This frame is built fresh per
+                # render, so serialize it directly rather than through the
+                # identity-keyed _to_geojson cache
+                shortage_outlines = shortage_data.loc[
+                    shortage_data.geometry.notna(), ['shortage', 'geometry']
+                ].reset_index()
+                if len(shortage_outlines) > 0:
+                    folium.GeoJson(
+                        json.loads(shortage_outlines.to_json()),
+                        style_function=lambda x: {
+                            'fillColor': 'transparent',
+                            'color': 'darkred',
+                            'weight': 2,
+                            'fillOpacity': 0
+                        },
+                        tooltip=folium.GeoJsonTooltip(
+                            fields=['subzone_name_clean', 'shortage'],
+                            aliases=['Subzone:', 'Shortage (preschools):'],
+                            localize=True
+                        )
+                    ).add_to(m)
                 
-                # Display the map
-                st_folium(m, width=700, height=500)
+                # Display the map statically (read-only, no rerun on pan/zoom)
+                folium_static(m, width=700, height=500)
                 
             else:
                 # Fallback to bar chart